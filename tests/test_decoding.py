@@ -0,0 +1,69 @@
+"""Tests for greedy decoding."""
+
+import mlx.core as mx
+import pytest
+
+from whisper_mlx.decoding import greedy_step
+
+
+def _reference_step(logits, next_tokens, last_tokens, sum_logprobs, eot):
+    """The uncompiled greedy update."""
+    logprobs = logits - mx.logsumexp(logits, axis=-1, keepdims=True)
+    current_logprobs = logprobs[mx.arange(logprobs.shape[0]), next_tokens]
+    sum_logprobs = sum_logprobs + current_logprobs * (last_tokens != eot)
+    eot_mask = last_tokens == eot
+    next_tokens = next_tokens * (1 - eot_mask) + eot * eot_mask
+    return next_tokens, mx.all(next_tokens == eot), sum_logprobs
+
+
+class TestGreedyStep:
+    """Tests for the compiled greedy update step."""
+
+    # alternate batch sizes and EOT ids so each call reuses or retraces a graph
+    @pytest.mark.parametrize(
+        "n_batch, eot", [(2, 3), (5, 3), (2, 7), (5, 7), (2, 3)]
+    )
+    def test_matches_reference(self, n_batch: int, eot: int) -> None:
+        """The compiled step matches the uncompiled expressions."""
+        mx.random.seed(n_batch * eot)
+        logits = mx.random.normal((n_batch, 10))
+        next_tokens = logits.argmax(axis=-1)
+        # every other sequence has already finished
+        last_tokens = mx.where(mx.arange(n_batch) % 2 == 0, eot, 1)
+        sum_logprobs = mx.random.normal((n_batch,))
+
+        tokens, completed, logprobs = greedy_step(
+            logits, next_tokens, last_tokens, sum_logprobs, eot
+        )
+        ref_tokens, ref_completed, ref_logprobs = _reference_step(
+            logits, next_tokens, last_tokens, sum_logprobs, eot
+        )
+
+        assert tokens.tolist() == ref_tokens.tolist()
+        assert completed.item() == ref_completed.item()
+        assert mx.allclose(logprobs, ref_logprobs).item()
+
+        finished = (last_tokens == eot).tolist()
+        for i, done in enumerate(finished):
+            if done:
+                # finished sequences are pinned to EOT and stop accumulating
+                assert tokens[i].item() == eot
+                assert logprobs[i].item() == sum_logprobs[i].item()
+            else:
+                assert logprobs[i].item() < sum_logprobs[i].item()
+
+    @pytest.mark.parametrize("eot", [3, 7])
+    def test_completed_when_all_finished(self, eot: int) -> None:
+        """completed is set only once every sequence has emitted EOT."""
+        logits = mx.zeros((2, 10))
+        sum_logprobs = mx.zeros((2,))
+
+        _, completed, _ = greedy_step(
+            logits, mx.array([eot, 1]), mx.array([1, 1]), sum_logprobs, eot
+        )
+        assert not completed.item()
+
+        _, completed, _ = greedy_step(
+            logits, mx.array([eot, 1]), mx.array([1, eot]), sum_logprobs, eot
+        )
+        assert completed.item()
@@ -1,18 +1,52 @@
 """Tests for model loading security features."""
 
+import json
 import os
 import tempfile
+import threading
+import time
+from dataclasses import asdict
 from pathlib import Path
 from unittest import mock
 
+import mlx.core as mx
+import mlx.nn as nn
 import pytest
+from mlx.utils import tree_flatten
 
+from whisper_mlx import whisper
 from whisper_mlx.load_models import (
+    ModelHolder,
     _get_allowed_model_dirs,
     load_model,
     validate_model_path,
 )
 
+TINY_DIMS = whisper.ModelDimensions(
+    n_mels=80,
+    n_audio_ctx=8,
+    n_audio_state=128,
+    n_audio_head=2,
+    n_audio_layer=1,
+    n_vocab=128,
+    n_text_ctx=8,
+    n_text_state=128,
+    n_text_head=2,
+    n_text_layer=1,
+)
+
+
+def _write_tiny_model(model_path: Path, filename: str = "model.safetensors") -> None:
+    """Write a randomly initialised float32 model to `model_path`."""
+    model_path.mkdir(parents=True, exist_ok=True)
+    (model_path / "config.json").write_text(json.dumps(asdict(TINY_DIMS)))
+    model = whisper.Whisper(TINY_DIMS, mx.float32)
+    weights = dict(tree_flatten(model.parameters()))
+    if filename.endswith(".npz"):
+        mx.savez(str(model_path / filename), **weights)
+    else:
+        mx.save_safetensors(str(model_path / filename), weights)
+
 
 class TestGetAllowedModelDirs:
     """Tests for _get_allowed_model_dirs function."""
@@ -179,3 +213,263 @@ class TestLoadModelSecurity:
                 with pytest.raises(TypeError):
                     # Missing required model args - but importantly it passed validation!
                     load_model(str(model_path))
+
+
+class TestLoadModelDtype:
+    """Tests for load-time dtype handling."""
+
+    def test_casts_float32_weights_to_float16_by_default(self) -> None:
+        """Float32 checkpoints are cast to the float16 default dtype."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                model = load_model(str(model_path))
+
+        dtypes = {
+            v.dtype
+            for _, v in tree_flatten(model.parameters())
+            if mx.issubdtype(v.dtype, mx.floating)
+        }
+        assert dtypes == {mx.float16}
+
+    def test_keeps_float32_when_requested(self) -> None:
+        """An explicit float32 dtype leaves the weights untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                model = load_model(str(model_path), dtype=mx.float32)
+
+        dtypes = {
+            v.dtype
+            for _, v in tree_flatten(model.parameters())
+            if mx.issubdtype(v.dtype, mx.floating)
+        }
+        assert dtypes == {mx.float32}
+
+
+class TestLoadModelWeightFiles:
+    """Tests for locating the weights file of a model directory."""
+
+    @pytest.mark.parametrize(
+        "filename", ["model.safetensors", "weights.safetensors", "weights.npz"]
+    )
+    def test_loads_supported_weight_files(self, filename: str) -> None:
+        """Each supported weights file name is found."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path, filename)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                model = load_model(str(model_path))
+
+        assert model.dims == TINY_DIMS
+
+    def test_raises_when_weights_missing(self) -> None:
+        """A model directory without weights raises FileNotFoundError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+            (model_path / "model.safetensors").unlink()
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                with pytest.raises(FileNotFoundError, match="No model weights found"):
+                    load_model(str(model_path))
+
+
+class TestLoadModelQuantize:
+    """Tests for load-time quantization of unquantized checkpoints."""
+
+    def test_quantizes_linear_and_embedding_layers(self) -> None:
+        """quantize replaces Linear and Embedding layers with quantized ones."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                model = load_model(
+                    str(model_path), quantize={"bits": 4, "group_size": 64}
+                )
+
+        assert isinstance(model.decoder.token_embedding, nn.QuantizedEmbedding)
+        assert isinstance(model.decoder.blocks[0].mlp1, nn.QuantizedLinear)
+        assert isinstance(model.encoder.blocks[0].attn.query, nn.QuantizedLinear)
+
+    def test_rejects_non_dict_quantize(self) -> None:
+        """quantize must be a dict of quantization arguments."""
+        with pytest.raises(TypeError, match="quantize must be a dict"):
+            load_model("mlx-community/whisper-tiny-mlx", quantize=4)
+
+    def test_int8_compute_type(self) -> None:
+        """compute_type="int8" quantizes weights to 8 bits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                model = load_model(str(model_path), compute_type="int8")
+
+        assert isinstance(model.decoder.blocks[0].mlp1, nn.QuantizedLinear)
+        assert model.decoder.blocks[0].mlp1.bits == 8
+
+    def test_rejects_unknown_compute_type(self) -> None:
+        """Unknown compute types are rejected before loading."""
+        with pytest.raises(ValueError, match="Unknown compute_type"):
+            load_model("mlx-community/whisper-tiny-mlx", compute_type="int4")
+
+    def test_rejects_compute_type_with_quantize(self) -> None:
+        """compute_type and quantize are mutually exclusive."""
+        with pytest.raises(ValueError, match="can't be given together"):
+            load_model(
+                "mlx-community/whisper-tiny-mlx",
+                compute_type="int8",
+                quantize={"bits": 4},
+            )
+
+
+class TestLoadModelFusedAttention:
+    """Tests for the fused self-attention kernel against the reference path."""
+
+    @pytest.mark.parametrize(
+        "dtype, atol", [(mx.float32, 1e-4), (mx.float16, 2e-2)]
+    )
+    def test_matches_unfused_attention(self, dtype: mx.Dtype, atol: float) -> None:
+        """Encoder output, prefill logits and a cached decode step all agree."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                fused = load_model(str(model_path), dtype=dtype, fused_attention=True)
+                unfused = load_model(
+                    str(model_path), dtype=dtype, fused_attention=False
+                )
+
+        assert fused.decoder.blocks[0].attn.fused_attention
+        assert not unfused.decoder.blocks[0].attn.fused_attention
+
+        mx.random.seed(0)
+        mel = mx.random.normal((2, 2 * TINY_DIMS.n_audio_ctx, TINY_DIMS.n_mels))
+        prefix = mx.array([[1, 2, 3, 4], [5, 6, 7, 8]])
+        step = mx.array([[9], [10]])
+
+        outputs = []
+        for model in (fused, unfused):
+            audio_features = model.encoder(mel.astype(dtype))
+            logits, kv_cache, _ = model.decoder(prefix, audio_features)
+            step_logits, _, _ = model.decoder(step, audio_features, kv_cache)
+            outputs.append((audio_features, logits, step_logits))
+
+        for fused_out, unfused_out in zip(*outputs):
+            assert fused_out.dtype == unfused_out.dtype
+            assert mx.allclose(
+                fused_out.astype(mx.float32),
+                unfused_out.astype(mx.float32),
+                atol=atol,
+                rtol=atol,
+            ).item()
+
+
+class TestModelHolder:
+    """Tests for the ModelHolder model cache."""
+
+    def setup_method(self) -> None:
+        ModelHolder.clear()
+
+    def teardown_method(self) -> None:
+        ModelHolder.clear()
+
+    def test_reuses_cached_model(self) -> None:
+        """Repeated requests for the same model load it once."""
+        with mock.patch(
+            "whisper_mlx.load_models.load_model", side_effect=lambda *a, **k: object()
+        ) as loader:
+            first = ModelHolder.get_model("repo/a", mx.float16)
+            second = ModelHolder.get_model("repo/a", mx.float16)
+
+        assert first is second
+        assert loader.call_count == 1
+
+    def test_keys_on_dtype_and_quantize(self) -> None:
+        """dtype and quantize settings are part of the cache key."""
+        with mock.patch(
+            "whisper_mlx.load_models.load_model", side_effect=lambda *a, **k: object()
+        ) as loader:
+            ModelHolder.get_model("repo/a", mx.float16)
+            ModelHolder.get_model("repo/a", mx.float32)
+            ModelHolder.get_model("repo/a", mx.float16, {"bits": 4})
+
+        assert loader.call_count == 3
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Only the most recently used models are kept."""
+        with mock.patch(
+            "whisper_mlx.load_models.load_model", side_effect=lambda *a, **k: object()
+        ) as loader:
+            ModelHolder.get_model("repo/a", mx.float16)
+            ModelHolder.get_model("repo/b", mx.float16)
+            ModelHolder.get_model("repo/a", mx.float16)  # a is now most recent
+            ModelHolder.get_model("repo/c", mx.float16)  # evicts b
+            ModelHolder.get_model("repo/a", mx.float16)
+            assert loader.call_count == 3
+
+            ModelHolder.get_model("repo/b", mx.float16)
+            assert loader.call_count == 4
+
+    def test_concurrent_requests_load_once(self) -> None:
+        """Concurrent misses for the same model trigger a single load."""
+
+        def slow_load(*args, **kwargs):
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        with mock.patch(
+            "whisper_mlx.load_models.load_model", side_effect=slow_load
+        ) as loader:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        ModelHolder.get_model("repo/a", mx.float16)
+                    )
+                )
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert loader.call_count == 1
+        assert all(r is results[0] for r in results)
+
+
+class TestLoadModelEager:
+    """Tests for eager weight evaluation."""
+
+    def _load(self, **kwargs) -> mock.MagicMock:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "model"
+            _write_tiny_model(model_path)
+
+            with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": tmpdir}):
+                with mock.patch("whisper_mlx.load_models.mx.eval") as eval_mock:
+                    load_model(str(model_path), **kwargs)
+        return eval_mock
+
+    def test_evaluates_full_precision_models(self) -> None:
+        """Unquantized models are evaluated before returning by default."""
+        assert self._load().call_count == 2
+
+    def test_skips_eval_for_quantized_models(self) -> None:
+        """Quantized models are left lazy by default."""
+        assert self._load(quantize={"bits": 4, "group_size": 64}).call_count == 0
+
+    def test_eager_overrides_default(self) -> None:
+        """An explicit eager flag takes precedence."""
+        assert self._load(eager=False).call_count == 0
+        quantize = {"bits": 4, "group_size": 64}
+        assert self._load(quantize=quantize, eager=True).call_count == 2
@@ -0,0 +1,61 @@
+"""Tests for tokenizer vocabulary loading."""
+
+import base64
+import os
+from pathlib import Path
+from unittest import mock
+
+from whisper_mlx.tokenizer import _load_ranks, _ranks_cache_path
+
+
+def _write_vocab(path: Path) -> dict:
+    ranks = {b"a": 0, b" the": 1, b"\xe2\x96": 2, b"\x00": 3}
+    path.write_text(
+        "".join(f"{base64.b64encode(t).decode()} {r}\n" for t, r in ranks.items())
+    )
+    return ranks
+
+
+class TestLoadRanks:
+    """Tests for the on-disk BPE rank cache."""
+
+    def test_parses_and_caches_ranks(self, tmp_path: Path) -> None:
+        """Ranks are parsed from the vocabulary and written to the cache."""
+        vocab = tmp_path / "test.tiktoken"
+        expected = _write_vocab(vocab)
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path / "cache")}):
+            assert _load_ranks(str(vocab)) == expected
+            assert os.path.isfile(_ranks_cache_path(str(vocab)))
+
+    def test_reads_ranks_from_cache(self, tmp_path: Path) -> None:
+        """A cached vocabulary is loaded without re-parsing the file."""
+        vocab = tmp_path / "test.tiktoken"
+        expected = _write_vocab(vocab)
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path / "cache")}):
+            _load_ranks(str(vocab))
+            with mock.patch("whisper_mlx.tokenizer.open", side_effect=AssertionError):
+                assert _load_ranks(str(vocab)) == expected
+
+    def test_ignores_corrupt_cache(self, tmp_path: Path) -> None:
+        """A corrupt cache file falls back to parsing the vocabulary."""
+        vocab = tmp_path / "test.tiktoken"
+        expected = _write_vocab(vocab)
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path / "cache")}):
+            cache_path = Path(_ranks_cache_path(str(vocab)))
+            cache_path.parent.mkdir(parents=True)
+            cache_path.write_bytes(b"not an npz file")
+
+            assert _load_ranks(str(vocab)) == expected
+
+    def test_unwritable_cache_dir_is_ignored(self, tmp_path: Path) -> None:
+        """Failing to write the cache does not fail tokenizer loading."""
+        vocab = tmp_path / "test.tiktoken"
+        expected = _write_vocab(vocab)
+        blocker = tmp_path / "cache"
+        blocker.write_text("a file where the cache directory should be")
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(blocker)}):
+            assert _load_ranks(str(vocab)) == expected
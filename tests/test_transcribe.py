@@ -0,0 +1,229 @@
+"""Tests for long-form transcription."""
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, List, Tuple
+from unittest import mock
+
+import mlx.core as mx
+import numpy as np
+import pytest
+from mlx.utils import tree_flatten
+
+from whisper_mlx import whisper
+from whisper_mlx.audio import (
+    HOP_LENGTH,
+    N_FRAMES,
+    N_SAMPLES,
+    SAMPLE_RATE,
+    log_mel_spectrogram,
+    pad_or_trim,
+)
+from whisper_mlx.decoding import decode as decode_function
+from whisper_mlx.load_models import ModelHolder
+from whisper_mlx.transcribe import transcribe
+
+# The encoder must produce 1500 frames per 30 s window, and the vocabulary must
+# cover the English tokenizer; everything else is kept as small as possible.
+TINY_DIMS = whisper.ModelDimensions(
+    n_mels=80,
+    n_audio_ctx=1500,
+    n_audio_state=64,
+    n_audio_head=2,
+    n_audio_layer=1,
+    n_vocab=51864,
+    n_text_ctx=32,
+    n_text_state=64,
+    n_text_head=2,
+    n_text_layer=1,
+)
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """A randomly initialised English model saved to an allowed model dir."""
+    root = tmp_path_factory.mktemp("models")
+    model_path = root / "tiny"
+    model_path.mkdir()
+    (model_path / "config.json").write_text(json.dumps(asdict(TINY_DIMS)))
+    mx.random.seed(0)
+    model = whisper.Whisper(TINY_DIMS, mx.float32)
+    mx.save_safetensors(
+        str(model_path / "model.safetensors"), dict(tree_flatten(model.parameters()))
+    )
+
+    ModelHolder.clear()
+    with mock.patch.dict(os.environ, {"WHISPER_MLX_MODEL_DIRS": str(root)}):
+        yield model_path
+    ModelHolder.clear()
+
+
+@pytest.fixture(scope="module")
+def audio() -> np.ndarray:
+    """About 95 s of noise: three full windows and a short tail."""
+    rng = np.random.default_rng(0)
+    return (0.1 * rng.standard_normal(95 * SAMPLE_RATE)).astype(np.float32)
+
+
+def _record_decodes(
+    model_dir: Path, audio: np.ndarray, **kwargs
+) -> Tuple[dict, List[Tuple[float, mx.array]]]:
+    """Run transcribe() and record the temperature and input of every decode call."""
+    calls = []
+
+    def recording_decode(model, mel, options, **decode_kwargs):
+        calls.append((options.temperature, mel))
+        return decode_function(model, mel, options, **decode_kwargs)
+
+    with mock.patch.object(whisper.Whisper, "decode", recording_decode):
+        result = transcribe(
+            audio, path_or_hf_repo=str(model_dir), language="en", **kwargs
+        )
+    return result, calls
+
+
+def _decode_temperatures(model_dir: Path, audio: np.ndarray, **kwargs) -> List[float]:
+    """Run transcribe() and return the temperature of every decode call."""
+    _, calls = _record_decodes(model_dir, audio, **kwargs)
+    return [temperature for temperature, _ in calls]
+
+
+def _segment_key(segment: dict) -> Tuple[float, float, List[int]]:
+    return segment["start"], segment["end"], segment["tokens"]
+
+
+class TestBatchedTemperature:
+    """Tests for the temperature schedule of batched decoding."""
+
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_scalar_temperature_never_falls_back(
+        self, model_dir: Path, audio: np.ndarray, batch_size: int
+    ) -> None:
+        """A scalar temperature decodes every window once at that temperature."""
+        temperatures = _decode_temperatures(
+            model_dir,
+            audio,
+            batch_size=batch_size,
+            temperature=0.0,
+            compression_ratio_threshold=0.0,  # every decode fails the threshold
+            logprob_threshold=None,
+            no_speech_threshold=None,
+        )
+
+        assert set(temperatures) == {0.0}
+
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_falls_back_through_schedule(
+        self, model_dir: Path, audio: np.ndarray, batch_size: int
+    ) -> None:
+        """Failing windows are retried at each later temperature of the schedule."""
+        temperatures = _decode_temperatures(
+            model_dir,
+            audio,
+            batch_size=batch_size,
+            temperature=(0.0, 0.5),
+            compression_ratio_threshold=0.0,
+            logprob_threshold=None,
+            no_speech_threshold=None,
+        )
+
+        assert set(temperatures) == {0.0, 0.5}
+        assert temperatures[:2] == [0.0, 0.5]
+
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_samples_best_of_candidates(
+        self, model_dir: Path, audio: np.ndarray, batch_size: int
+    ) -> None:
+        """best_of candidates are sampled for every window of a batch."""
+        result, calls = _record_decodes(
+            model_dir, audio, batch_size=batch_size, temperature=0.5, best_of=2
+        )
+
+        assert {temperature for temperature, _ in calls} == {0.5}
+        assert result["segments"]
+
+
+class TestBatchedTranscribe:
+    """Tests for the batched window loop and its encoder prefetch."""
+
+    def test_batch_inputs(self, model_dir: Path, audio: np.ndarray) -> None:
+        """Batches are decoded from encoded features, a lone tail window from its mel."""
+        n_audio_ctx, n_audio_state = TINY_DIMS.n_audio_ctx, TINY_DIMS.n_audio_state
+        shapes = {}
+        for batch_size in [1, 2, 3]:
+            _, calls = _record_decodes(
+                model_dir, audio, batch_size=batch_size, temperature=0.0
+            )
+            shapes[batch_size] = [mel.shape for _, mel in calls]
+            # the mel is cast to the model dtype once, before slicing windows
+            assert {mel.dtype for _, mel in calls} == {mx.float16}
+
+        assert all(shape == (N_FRAMES, TINY_DIMS.n_mels) for shape in shapes[1])
+        assert shapes[2] == [(2, n_audio_ctx, n_audio_state)] * 2
+        assert shapes[3] == [
+            (3, n_audio_ctx, n_audio_state),
+            (N_FRAMES, TINY_DIMS.n_mels),
+        ]
+
+    def test_prefetched_features_match_windows(
+        self, model_dir: Path, audio: np.ndarray
+    ) -> None:
+        """Each batch, prefetched or not, is decoded from the features of its windows."""
+        _, calls = _record_decodes(model_dir, audio, batch_size=2, temperature=0.0)
+
+        model = ModelHolder.get_model(str(model_dir), mx.float16)
+        mel = log_mel_spectrogram(audio, padding=N_SAMPLES).astype(mx.float16)
+        content_frames = mel.shape[-2] - N_FRAMES
+        windows = [
+            pad_or_trim(
+                mel[seek : min(seek + N_FRAMES, content_frames)], N_FRAMES, axis=-2
+            )
+            for seek in range(0, content_frames, N_FRAMES)
+        ]
+        assert len(windows) == 4
+
+        for (_, features), batch in zip(calls, [windows[:2], windows[2:]], strict=True):
+            expected = model.encoder(mx.stack(batch))
+            assert mx.allclose(features, expected).item()
+
+    def test_prefetched_batches_match_single_batch(
+        self, model_dir: Path, audio: np.ndarray
+    ) -> None:
+        """Windows decode the same whether or not their batch was prefetched."""
+        options = dict(temperature=0.0, condition_on_previous_text=False)
+        single, _ = _record_decodes(model_dir, audio, batch_size=4, **options)
+        prefetched, _ = _record_decodes(model_dir, audio, batch_size=2, **options)
+        with_tail, _ = _record_decodes(model_dir, audio, batch_size=3, **options)
+
+        expected = [_segment_key(s) for s in single["segments"]]
+        assert [_segment_key(s) for s in prefetched["segments"]] == expected
+
+        # batch_size=3 decodes the last, partial window through the serial path
+        tail_start = 3 * N_FRAMES * HOP_LENGTH / SAMPLE_RATE
+        assert [
+            _segment_key(s) for s in with_tail["segments"] if s["start"] < tail_start
+        ] == [key for key in expected if key[0] < tail_start]
+
+    def test_fallback_decodes_features(self, model_dir: Path, audio: np.ndarray) -> None:
+        """Windows re-decoded from stacked features reproduce the first pass."""
+        options = dict(
+            batch_size=2,
+            condition_on_previous_text=False,
+            logprob_threshold=None,
+            no_speech_threshold=None,
+        )
+        first_pass, _ = _record_decodes(model_dir, audio, temperature=0.0, **options)
+        fallback, calls = _record_decodes(
+            model_dir,
+            audio,
+            temperature=(0.0, 0.0),
+            compression_ratio_threshold=0.0,  # every window falls back
+            **options,
+        )
+
+        assert len(calls) == 4
+        assert [_segment_key(s) for s in fallback["segments"]] == [
+            _segment_key(s) for s in first_pass["segments"]
+        ]
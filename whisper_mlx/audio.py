@@ -3,7 +3,7 @@
 import os
 from functools import lru_cache
 from subprocess import CalledProcessError, run
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import mlx.core as mx
 import numpy as np
@@ -106,6 +106,27 @@ def hanning(size: int) -> mx.array:
     return mx.array(np.hanning(size + 1)[:-1])
 
 
+# (n_fft, n_mels, sample_rate) -> (window, transposed mel filterbank)
+_MEL_CACHE: Dict[Tuple[int, int, int], Tuple[mx.array, mx.array]] = {}
+
+
+def _mel_constants(n_mels: int) -> Tuple[mx.array, mx.array]:
+    """
+    Return the Hann window and the transposed mel filterbank for `n_mels`.
+
+    Both are evaluated once when the cache is filled, so subsequent calls to
+    `log_mel_spectrogram` only launch the STFT and projection kernels.
+    """
+    key = (N_FFT, n_mels, SAMPLE_RATE)
+    constants = _MEL_CACHE.get(key)
+    if constants is None:
+        window = hanning(N_FFT)
+        filters_t = mel_filters(n_mels).T
+        mx.eval(window, filters_t)
+        constants = _MEL_CACHE[key] = (window, filters_t)
+    return constants
+
+
 def stft(
     x: mx.array,
     window: mx.array,
@@ -171,12 +192,11 @@ def log_mel_spectrogram(
 
     if padding > 0:
         audio = mx.pad(audio, (0, padding))
-    window = hanning(N_FFT)
+    window, filters_t = _mel_constants(n_mels)
     freqs = stft(audio, window, nperseg=N_FFT, noverlap=HOP_LENGTH)
     magnitudes = freqs[:-1, :].abs().square()
 
-    filters = mel_filters(n_mels)
-    mel_spec = magnitudes @ filters.T
+    mel_spec = magnitudes @ filters_t
 
     log_spec = mx.maximum(mel_spec, 1e-10).log10()
     log_spec = mx.maximum(log_spec, log_spec.max() - 8.0)
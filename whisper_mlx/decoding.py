@@ -256,6 +256,26 @@ def categorical(logits, temp):
     return mx.random.categorical(logits / temp)
 
 
+@mx.compile
+def greedy_step(logits, next_tokens, last_tokens, sum_logprobs, eot):
+    """Accumulate log probabilities and pin finished sequences to EOT.
+
+    Takes only fixed-shape inputs, so the compiled graph is traced once per
+    (batch size, vocabulary size) and reused for every step and every call
+    within the process.
+    """
+    logprobs = logits - mx.logsumexp(logits, axis=-1, keepdims=True)
+
+    current_logprobs = logprobs[mx.arange(logprobs.shape[0]), next_tokens]
+    sum_logprobs = sum_logprobs + current_logprobs * (last_tokens != eot)
+
+    eot_mask = last_tokens == eot
+    next_tokens = next_tokens * (1 - eot_mask) + eot * eot_mask
+
+    completed = mx.all(next_tokens == eot)
+    return next_tokens, completed, sum_logprobs
+
+
 class GreedyDecoder(TokenDecoder):
     def __init__(self, temperature: float, eot: int):
         self.temperature = temperature
@@ -269,16 +289,10 @@ class GreedyDecoder(TokenDecoder):
         else:
             next_tokens = categorical(logits, self.temperature)
 
-        logprobs = logits - mx.logsumexp(logits, axis=-1, keepdims=True)
-
-        current_logprobs = logprobs[mx.arange(logprobs.shape[0]), next_tokens]
-        sum_logprobs += current_logprobs * (tokens[:, -1] != self.eot)
-
-        eot_mask = tokens[:, -1] == self.eot
-        next_tokens = next_tokens * (1 - eot_mask) + self.eot * eot_mask
+        next_tokens, completed, sum_logprobs = greedy_step(
+            logits, next_tokens, tokens[:, -1], sum_logprobs, self.eot
+        )
         tokens = mx.concatenate([tokens, next_tokens[:, None]], axis=-1)
-
-        completed = mx.all(tokens[:, -1] == self.eot)
         return tokens, completed, sum_logprobs
 
     def finalize(self, tokens: mx.array, sum_logprobs: mx.array):
@@ -446,7 +460,7 @@ class DecodingTask:
         self.sequence_ranker = MaximumLikelihoodRanker(options.length_penalty)
 
         # decoder: implements how to select the next tokens, given the autoregressive distribution
-        if options.beam_size is not None:
+        if options.beam_size is not None and options.beam_size > 1:
             raise NotImplementedError("Beam search decoder is not yet implemented")
         else:
             self.decoder = GreedyDecoder(options.temperature, tokenizer.eot)
@@ -651,8 +665,9 @@ class DecodingTask:
                 )
             ]
 
-        # repeat tokens by the group size, for beam search or best-of-n sampling
+        # repeat audio features and tokens by the group size, for beam search or best-of-n sampling
         if self.n_group > 1:
+            audio_features = mx.repeat(audio_features, self.n_group, axis=0)
             tokens = tokens[:, None, :]
             tokens = mx.broadcast_to(
                 tokens, [n_audio, self.n_group, len(self.initial_tokens)]
@@ -1,13 +1,13 @@
 # Copyright © 2024 Mustafa Aljadery & Siddharth Sharma
 # Simple API wrapper for quick transcription
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import mlx.core as mx
 import numpy as np
 
 from .transcribe import transcribe as transcribe_audio
-from .utils import MODEL_REPOS, QUANT_REPOS, resolve_model_path
+from .utils import MODEL_REPOS, QUANT_REPOS, resolve_model_path, resolve_quantization
 
 
 class LightningWhisperMLX:
@@ -56,7 +56,10 @@ class LightningWhisperMLX:
             Recommended: 12 for distil models, 6 for large models.
 
         quant : str, optional
-            Quantization level: "4bit" or "8bit". Only supported for some models.
+            Quantization level: "4bit" or "8bit" for pre-quantized repos (only
+            supported for some models), or "4bit-runtime" to quantize any model
+            to 4 bits at load time. "8bit" falls back to int8 load-time
+            quantization for models without a pre-quantized repo.
         """
         if batch_size < 1:
             raise ValueError(f"batch_size must be >= 1, got {batch_size}")
@@ -65,6 +68,7 @@ class LightningWhisperMLX:
         self.quant = quant
         self.name = model
         self.model_path = resolve_model_path(model, quant)
+        self.quantize = resolve_quantization(quant, model)
 
     def transcribe(
         self,
@@ -73,6 +77,9 @@ class LightningWhisperMLX:
         task: str = "transcribe",
         verbose: Optional[bool] = None,
         word_timestamps: bool = False,
+        beam_size: int = 1,
+        temperature: Union[float, Tuple[float, ...]] = 0.0,
+        best_of: int = 1,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -98,12 +105,24 @@ class LightningWhisperMLX:
         word_timestamps : bool
             Whether to include word-level timestamps.
 
+        beam_size : int
+            Number of beams at temperature 0. The default of 1 is plain greedy
+            decoding; beam search (beam_size > 1) is not implemented yet.
+
+        temperature : float | tuple of float
+            Sampling temperature. The default of 0.0 decodes greedily in a single
+            pass. Pass a schedule such as (0.0, 0.2, 0.4, 0.6, 0.8, 1.0) to retry
+            segments that fail the quality thresholds at higher temperatures.
+
+        best_of : int
+            Number of candidates sampled when the temperature is above 0.
+
         **kwargs
             All transcribe() parameters are supported:
-            - temperature, compression_ratio_threshold, logprob_threshold
+            - compression_ratio_threshold, logprob_threshold
             - no_speech_threshold, condition_on_previous_text, initial_prompt
             - prepend_punctuations, append_punctuations, clip_timestamps
-            - hallucination_silence_threshold, fp16, beam_size, patience, etc.
+            - hallucination_silence_threshold, fp16, patience, etc.
 
         Returns
         -------
@@ -117,10 +136,14 @@ class LightningWhisperMLX:
             audio,
             path_or_hf_repo=self.model_path,
             batch_size=self.batch_size,
+            quantize=self.quantize,
             language=language,
             task=task,
             verbose=verbose,
             word_timestamps=word_timestamps,
+            beam_size=beam_size,
+            temperature=temperature,
+            best_of=best_of,
             **kwargs,
         )
 
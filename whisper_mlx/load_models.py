@@ -2,15 +2,22 @@
 
 import json
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 import mlx.core as mx
 import mlx.nn as nn
-from huggingface_hub import snapshot_download
 from mlx.utils import tree_unflatten
 
 from . import whisper
+from .utils import RUNTIME_QUANT
+
+# Named load-time quantization presets for `load_model(compute_type=...)`
+COMPUTE_TYPES = {
+    "int8": RUNTIME_QUANT["8bit"],
+}
 
 
 def _get_allowed_model_dirs() -> list[Path]:
@@ -69,8 +76,35 @@ def validate_model_path(path: Path) -> Path:
 
 def load_model(
     path_or_hf_repo: str,
-    dtype: mx.Dtype = mx.float32,
+    dtype: mx.Dtype = mx.float16,
+    quantize: Optional[dict] = None,
+    eager: Optional[bool] = None,
+    fused_attention: bool = True,
+    compute_type: Optional[str] = None,
 ) -> whisper.Whisper:
+    """Load a Whisper model from a local directory or the HuggingFace Hub.
+
+    Args:
+        path_or_hf_repo: Local model directory or HuggingFace repo id
+        dtype: Compute dtype; float32 checkpoint tensors are cast to it
+        quantize: Arguments for load-time quantization of an unquantized
+            checkpoint, e.g. {"bits": 4, "group_size": 64}
+        eager: Evaluate the weights before returning. Defaults to True for
+            full-precision models and False for quantized ones, whose weights
+            are small enough to page in on first use.
+        fused_attention: Run encoder and decoder self-attention through
+            mx.fast.scaled_dot_product_attention. Cross-attention keeps the
+            explicit path because its weights are used for word timestamps.
+        compute_type: Named quantization preset, shorthand for `quantize`.
+            "int8" quantizes weights to 8 bits with a group size of 128.
+
+    Returns:
+        The loaded model
+
+    Raises:
+        ValueError: If the path is invalid or outside the allowed directories
+        FileNotFoundError: If the model directory contains no weights file
+    """
     # Validate inputs
     if not path_or_hf_repo or not isinstance(path_or_hf_repo, str):
         raise ValueError("path_or_hf_repo must be a non-empty string")
@@ -78,12 +112,28 @@ def load_model(
     if not isinstance(dtype, mx.Dtype):
         raise TypeError(f"dtype must be an mx.Dtype, got {type(dtype).__name__}")
 
+    if quantize is not None and not isinstance(quantize, dict):
+        raise TypeError(f"quantize must be a dict, got {type(quantize).__name__}")
+
+    if compute_type is not None:
+        if compute_type not in COMPUTE_TYPES:
+            raise ValueError(
+                f"Unknown compute_type: {compute_type}. "
+                f"Available: {list(COMPUTE_TYPES.keys())}"
+            )
+        if quantize is not None:
+            raise ValueError("compute_type and quantize can't be given together")
+        quantize = COMPUTE_TYPES[compute_type]
+
     model_path = Path(path_or_hf_repo)
     if model_path.exists():
         # Validate local paths to prevent path traversal attacks
         model_path = validate_model_path(model_path)
     else:
-        # Download from HuggingFace Hub (automatically goes to allowed cache dir)
+        # Download from HuggingFace Hub (automatically goes to allowed cache dir).
+        # Imported lazily: slow to import and not needed for local models.
+        from huggingface_hub import snapshot_download
+
         model_path = Path(snapshot_download(repo_id=path_or_hf_repo))
 
     with open(str(model_path / "config.json"), "r") as f:
@@ -94,13 +144,29 @@ def load_model(
     model_args = whisper.ModelDimensions(**config)
 
     # Prefer model.safetensors, fall back to weights.safetensors, then weights.npz
-    wf = model_path / "model.safetensors"
-    if not wf.exists():
-        wf = model_path / "weights.safetensors"
-    if not wf.exists():
-        wf = model_path / "weights.npz"
+    entries = set(os.listdir(model_path))
+    weight_files = ("model.safetensors", "weights.safetensors", "weights.npz")
+    weight_file = next((n for n in weight_files if n in entries), None)
+    if weight_file is None:
+        raise FileNotFoundError(
+            f"No model weights found in '{model_path}'. "
+            f"Expected one of: {', '.join(weight_files)}"
+        )
+    wf = model_path / weight_file
+    # mx.load is lazy: tensors are only read from the file when first evaluated,
+    # so keep everything below lazy and evaluate once, after model.update().
     weights = mx.load(str(wf))
 
+    # Cast full-precision weights to the compute dtype at load time. Quantization
+    # scales/biases keep their stored dtype. LayerNorm parameters are cast too:
+    # mx.fast.layer_norm accumulates in float32 internally regardless.
+    weights = {
+        k: v.astype(dtype)
+        if v.dtype == mx.float32 and not k.endswith((".scales", ".biases"))
+        else v
+        for k, v in weights.items()
+    }
+
     model = whisper.Whisper(model_args, dtype)
 
     if quantization is not None:
@@ -112,20 +178,74 @@ def load_model(
 
     weights = tree_unflatten(list(weights.items()))
     model.update(weights)
-    mx.eval(model.parameters())
+
+    # Opt-in weight-only quantization of checkpoints that ship unquantized
+    if quantize is not None and quantization is None:
+        nn.quantize(
+            model,
+            bits=quantize.get("bits", 4),
+            group_size=quantize.get("group_size", 64),
+            class_predicate=lambda p, m: isinstance(m, (nn.Linear, nn.Embedding)),
+        )
+
+    if fused_attention:
+        for _, module in model.named_modules():
+            if isinstance(module, whisper.MultiHeadAttention):
+                module.fused_attention = True
+
+    if eager is None:
+        eager = quantization is None and quantize is None
+    if eager:
+        # Evaluate per sub-model so load failures point at the encoder or decoder
+        mx.eval(model.encoder.parameters())
+        mx.eval(model.decoder.parameters())
     return model
 
 
 class ModelHolder:
-    """Singleton cache for loaded Whisper models."""
+    """Thread-safe LRU cache for loaded Whisper models.
 
-    model: Optional[whisper.Whisper] = None
-    model_path: Optional[str] = None
+    Keeps the most recently used `max_models` models, keyed by
+    (model_path, dtype, quantize), so switching back and forth between two
+    models does not reload weights. Concurrent misses for the same key load
+    the model once.
+    """
+
+    max_models: int = 2
+    _models: "OrderedDict[tuple, whisper.Whisper]" = OrderedDict()
+    _lock = threading.Lock()
 
     @classmethod
-    def get_model(cls, model_path: str, dtype: mx.Dtype) -> whisper.Whisper:
+    def get_model(
+        cls, model_path: str, dtype: mx.Dtype, quantize: Optional[dict] = None
+    ) -> whisper.Whisper:
         """Get a cached model or load a new one."""
-        if cls.model is None or model_path != cls.model_path:
-            cls.model = load_model(model_path, dtype=dtype)
-            cls.model_path = model_path
-        return cls.model
+        key = (
+            model_path,
+            dtype,
+            tuple(sorted(quantize.items())) if quantize is not None else None,
+        )
+
+        # Fast path: no lock needed for a cache hit
+        model = cls._models.get(key)
+        if model is not None:
+            try:
+                cls._models.move_to_end(key)
+            except KeyError:
+                pass  # evicted concurrently; the caller still holds the model
+            return model
+
+        with cls._lock:
+            model = cls._models.get(key)
+            if model is None:
+                model = load_model(model_path, dtype=dtype, quantize=quantize)
+                cls._models[key] = model
+                while len(cls._models) > cls.max_models:
+                    cls._models.popitem(last=False)
+        return model
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached models."""
+        with cls._lock:
+            cls._models.clear()
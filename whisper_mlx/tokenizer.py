@@ -3,10 +3,12 @@
 import base64
 import os
 import string
+import tempfile
 from dataclasses import dataclass, field
 from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import tiktoken
 
 LANGUAGES = {
@@ -329,14 +331,68 @@ class Tokenizer:
         return words, word_tokens
 
 
-@lru_cache(maxsize=None)
-def get_encoding(name: str = "gpt2", num_languages: int = 99):
-    vocab_path = os.path.join(os.path.dirname(__file__), "assets", f"{name}.tiktoken")
+def _ranks_cache_path(vocab_path: str) -> str:
+    cache_home = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    # key on the asset's size and mtime so an upgraded vocabulary is re-parsed
+    stat = os.stat(vocab_path)
+    name = f"{os.path.basename(vocab_path)}-{stat.st_size}-{int(stat.st_mtime)}.npz"
+    return os.path.join(cache_home, "whisper_mlx", name)
+
+
+def _load_ranks(vocab_path: str) -> Dict[bytes, int]:
+    """
+    Load the BPE ranks of a .tiktoken file.
+
+    Parsing the base64 vocabulary dominates tokenizer start-up, so the parsed
+    ranks are cached as a (pickle-free) npz file under ~/.cache/whisper_mlx and
+    reused by later processes. Any cache error falls back to parsing the file.
+    """
+    cache_path = _ranks_cache_path(vocab_path)
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            blob = data["blob"].tobytes()
+            ends = np.cumsum(data["lengths"]).tolist()
+            ranks = data["ranks"].tolist()
+        starts = [0] + ends[:-1]
+        return {blob[s:e]: r for s, e, r in zip(starts, ends, ranks)}
+    except Exception:
+        pass  # missing or unreadable cache; re-parse and rewrite it below
+
     with open(vocab_path) as fid:
         ranks = {
             base64.b64decode(token): int(rank)
             for token, rank in (line.split() for line in fid if line)
         }
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    blob=np.frombuffer(b"".join(ranks), dtype=np.uint8),
+                    lengths=np.fromiter(map(len, ranks), dtype=np.int64),
+                    ranks=np.fromiter(ranks.values(), dtype=np.int64),
+                )
+            # atomic, so concurrent readers never see a partial file
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+    return ranks
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = "gpt2", num_languages: int = 99):
+    vocab_path = os.path.join(os.path.dirname(__file__), "assets", f"{name}.tiktoken")
+    ranks = _load_ranks(vocab_path)
     n_vocab = len(ranks)
     special_tokens = {}
 
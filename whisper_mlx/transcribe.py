@@ -42,6 +42,7 @@ def transcribe(
     *,
     path_or_hf_repo: str = "mlx-community/whisper-turbo",
     batch_size: int = 1,
+    quantize: Optional[dict] = None,
     verbose: Optional[bool] = None,
     temperature: Union[float, Tuple[float, ...]] = TEMPERATURE_SCHEDULE,
     compression_ratio_threshold: Optional[float] = COMPRESSION_RATIO_THRESHOLD,
@@ -71,6 +72,10 @@ def transcribe(
         Number of audio segments to process in parallel. Higher values use more memory
         but can significantly improve throughput. Default is 1 (sequential processing).
 
+    quantize: Optional[dict]
+        Quantize an unquantized checkpoint at load time, e.g. {"bits": 4, "group_size": 64}.
+        Ignored for checkpoints that are already quantized.
+
     verbose: bool
         Whether to display the text being decoded to the console. If True, displays all the details,
         If False, displays minimal details. If None, does not display anything
@@ -146,10 +151,12 @@ def transcribe(
         )
 
     dtype = mx.float16 if decode_options.get("fp16", True) else mx.float32
-    model = ModelHolder.get_model(path_or_hf_repo, dtype)
+    model = ModelHolder.get_model(path_or_hf_repo, dtype, quantize)
 
     # Pad 30-seconds of silence to the input audio, for slicing
+    # Cast once up front so windows are sliced straight into the encoder dtype
     mel = log_mel_spectrogram(audio, n_mels=model.dims.n_mels, padding=N_SAMPLES)
+    mel = mel.astype(dtype)
     content_frames = mel.shape[-2] - N_FRAMES
     content_duration = float(content_frames * HOP_LENGTH / SAMPLE_RATE)
 
@@ -171,7 +178,7 @@ def transcribe(
                     "Detecting language using up to the first 30 seconds. "
                     "Use the `language` decoding option to specify the language"
                 )
-            mel_segment = pad_or_trim(mel, N_FRAMES, axis=-2).astype(dtype)
+            mel_segment = pad_or_trim(mel, N_FRAMES, axis=-2)
             _, probs = model.detect_language(mel_segment)
             decode_options["language"] = max(probs, key=probs.get)
             if verbose is not None:
@@ -250,57 +257,102 @@ def transcribe(
     def decode_batch_with_fallback(segment_batch: mx.array) -> List[DecodingResult]:
         """Decode a batch of segments with per-segment temperature fallback.
 
-        Optimized: Collects all segments needing fallback and batches them together
-        instead of decoding each one individually (which destroys parallelism).
+        The whole batch is decoded at the first temperature of the schedule. The
+        segments that fail the quality thresholds are then re-decoded together at
+        each following temperature, instead of one at a time, which would destroy
+        parallelism.
         """
-        kwargs = {**decode_options}
-        kwargs.pop("beam_size", None)
-        kwargs.pop("patience", None)
-        kwargs.pop("best_of", None)
-
-        # First pass: decode all segments at temperature 0
-        options = DecodingOptions(**kwargs, temperature=0.0)
-        decode_results = model.decode(segment_batch, options)
-
-        # Collect indices of segments needing fallback (instead of processing individually)
-        fallback_indices = []
-        for i, decode_result in enumerate(decode_results):
-            needs_fallback = False
-            if (
-                compression_ratio_threshold is not None
-                and decode_result.compression_ratio > compression_ratio_threshold
-            ):
-                needs_fallback = True
-            if (
-                logprob_threshold is not None
-                and decode_result.avg_logprob < logprob_threshold
-            ):
-                needs_fallback = True
-            if (
-                no_speech_threshold is not None
-                and decode_result.no_speech_prob > no_speech_threshold
-            ):
-                needs_fallback = False  # Silence, no fallback needed
+        temperatures = (
+            [temperature] if isinstance(temperature, (int, float)) else temperature
+        )
+        decode_results = None
+        pending_indices = None
 
-            if needs_fallback:
-                fallback_indices.append(i)
+        for t in temperatures:
+            kwargs = {**decode_options}
+            if t > 0:
+                # disable beam_size and patience when t > 0
+                kwargs.pop("beam_size", None)
+                kwargs.pop("patience", None)
+            else:
+                # disable best_of when t == 0
+                kwargs.pop("best_of", None)
 
-        # Batch all fallback segments together (instead of individual decoding)
-        if fallback_indices:
-            # Stack all segments needing fallback into one batch
-            fallback_segments = mx.stack([segment_batch[i] for i in fallback_indices], axis=0)
-            fallback_options = DecodingOptions(**kwargs, temperature=1.0)
-            fallback_results = model.decode(fallback_segments, fallback_options)
+            options = DecodingOptions(**kwargs, temperature=t)
+            if decode_results is None:
+                decode_results = model.decode(segment_batch, options)
+                pending_indices = range(len(decode_results))
+            else:
+                # Stack all segments needing fallback into one batch
+                fallback_segments = mx.stack(
+                    [segment_batch[i] for i in pending_indices], axis=0
+                )
+                fallback_results = model.decode(fallback_segments, options)
+                for idx, fallback_result in zip(pending_indices, fallback_results):
+                    decode_results[idx] = fallback_result
+
+            # Collect indices of segments still needing fallback
+            fallback_indices = []
+            for i in pending_indices:
+                decode_result = decode_results[i]
+                needs_fallback = False
+                if (
+                    compression_ratio_threshold is not None
+                    and decode_result.compression_ratio > compression_ratio_threshold
+                ):
+                    needs_fallback = True
+                if (
+                    logprob_threshold is not None
+                    and decode_result.avg_logprob < logprob_threshold
+                ):
+                    needs_fallback = True
+                if (
+                    no_speech_threshold is not None
+                    and decode_result.no_speech_prob > no_speech_threshold
+                ):
+                    needs_fallback = False  # Silence, no fallback needed
+
+                if needs_fallback:
+                    fallback_indices.append(i)
+
+            if not fallback_indices:
+                break
+            pending_indices = fallback_indices
 
-            # Ensure fallback_results is a list
-            if not isinstance(fallback_results, list):
-                fallback_results = [fallback_results]
+        return decode_results
 
-            # Update decode_results with fallback results
-            for idx, fallback_result in zip(fallback_indices, fallback_results):
-                decode_results[idx] = fallback_result
+    def encode_batch(
+        batch_seek: int, seek_clip_end: int
+    ) -> Tuple[mx.array, List[int], List[int]]:
+        """Stack up to `batch_size` windows from `batch_seek` and start encoding them.
 
-        return decode_results
+        The encoder pass is dispatched with `mx.async_eval`, so it can overlap with
+        host-side work until the features are consumed by the decoder.
+        """
+        mel_segments = []
+        segment_seeks = []
+        segment_sizes = []
+
+        for _ in range(batch_size):
+            if batch_seek >= seek_clip_end:
+                break
+
+            segment_size = min(
+                N_FRAMES, content_frames - batch_seek, seek_clip_end - batch_seek
+            )
+            mel_segment = mel[batch_seek : batch_seek + segment_size]
+            mel_segment = pad_or_trim(mel_segment, N_FRAMES, axis=-2)
+
+            mel_segments.append(mel_segment)
+            segment_seeks.append(batch_seek)
+            segment_sizes.append(segment_size)
+
+            batch_seek += N_FRAMES
+
+        mel_batch = mx.stack(mel_segments, axis=0)
+        audio_features = model.encoder(mel_batch)
+        mx.async_eval(audio_features)
+        return audio_features, segment_seeks, segment_sizes
 
     clip_idx = 0
     seek = seek_clips[clip_idx][0]
@@ -342,38 +394,31 @@ def transcribe(
         last_speech_timestamp = 0.0
         for seek_clip_start, seek_clip_end in seek_clips:
             seek = seek_clip_start
+            pending_batch = None
 
             while seek < seek_clip_end:
-                # Batched processing: collect multiple segments
-                if batch_size > 1:
-                    mel_segments = []
-                    segment_seeks = []
-                    segment_sizes = []
-
-                    batch_seek = seek
-                    for _ in range(batch_size):
-                        if batch_seek >= seek_clip_end:
-                            break
-
-                        segment_size = min(
-                            N_FRAMES, content_frames - batch_seek, seek_clip_end - batch_seek
+                # Batched processing: collect multiple segments. A lone remaining
+                # window gains nothing from batching, so it takes the serial path.
+                if batch_size > 1 and seek_clip_end - seek > N_FRAMES:
+                    if pending_batch is not None and pending_batch[0] == seek:
+                        _, audio_features, segment_seeks, segment_sizes = pending_batch
+                    else:
+                        audio_features, segment_seeks, segment_sizes = encode_batch(
+                            seek, seek_clip_end
                         )
-                        mel_segment = mel[batch_seek : batch_seek + segment_size]
-                        mel_segment = pad_or_trim(mel_segment, N_FRAMES, axis=-2).astype(dtype)
-
-                        mel_segments.append(mel_segment)
-                        segment_seeks.append(batch_seek)
-                        segment_sizes.append(segment_size)
-
-                        batch_seek += N_FRAMES
+                    pending_batch = None
+                    batch_seek = segment_seeks[-1] + N_FRAMES
 
-                    if not mel_segments:
-                        break
-
-                    # Stack segments into a batch
-                    mel_batch = mx.stack(mel_segments, axis=0)
                     decode_options["prompt"] = all_tokens[prompt_reset_since:]
-                    results = decode_batch_with_fallback(mel_batch)
+                    results = decode_batch_with_fallback(audio_features)
+
+                    # Queue the next batch's encoder pass so it runs while the
+                    # results of this batch are post-processed on the host
+                    if seek_clip_end - batch_seek > N_FRAMES:
+                        pending_batch = (
+                            batch_seek,
+                            *encode_batch(batch_seek, seek_clip_end),
+                        )
 
                     # Process each result in the batch
                     for batch_idx, result in enumerate(results):
@@ -477,7 +522,7 @@ def transcribe(
                     )
                     mel_segment = mel[seek : seek + segment_size]
                     segment_duration = segment_size * HOP_LENGTH / SAMPLE_RATE
-                    mel_segment = pad_or_trim(mel_segment, N_FRAMES, axis=-2).astype(dtype)
+                    mel_segment = pad_or_trim(mel_segment, N_FRAMES, axis=-2)
 
                     decode_options["prompt"] = all_tokens[prompt_reset_since:]
                     result: DecodingResult = decode_with_fallback(mel_segment)
@@ -83,6 +83,13 @@ QUANT_REPOS = {
     },
 }
 
+# Quantization applied at load time to unquantized checkpoints
+RUNTIME_QUANT = {
+    "4bit-runtime": {"bits": 4, "group_size": 64},
+    # int8 weights; only used when no pre-quantized 8bit repo exists
+    "8bit": {"bits": 8, "group_size": 128},
+}
+
 
 def resolve_model_path(
     model: str, quant: Optional[str] = None
@@ -122,3 +129,27 @@ def resolve_model_path(
     raise ValueError(
         f"Unknown model: {model}. Available models: {list(MODEL_REPOS.keys())}"
     )
+
+
+def resolve_quantization(
+    quant: Optional[str] = None, model: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Resolve a quantization level to a load-time quantization config.
+
+    Parameters
+    ----------
+    quant : str, optional
+        Quantization level, e.g. "4bit-runtime" or "8bit"
+    model : str, optional
+        Model name, used to check for a pre-quantized repo
+
+    Returns
+    -------
+    dict or None
+        Arguments for `load_model(quantize=...)`, or None if the level is
+        served by a pre-quantized repo (or no quantization was requested)
+    """
+    if not quant or quant in QUANT_REPOS.get(model, {}):
+        return None
+    return RUNTIME_QUANT.get(quant)
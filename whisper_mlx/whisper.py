@@ -45,6 +45,8 @@ class MultiHeadAttention(nn.Module):
         self.key = nn.Linear(n_state, n_state, bias=False)
         self.value = nn.Linear(n_state, n_state)
         self.out = nn.Linear(n_state, n_state)
+        # use the fused attention kernel for self-attention (see load_model)
+        self.fused_attention = False
 
     def __call__(
         self,
@@ -67,9 +69,28 @@ class MultiHeadAttention(nn.Module):
         else:
             k, v = kv_cache
 
+        if xa is None and self.fused_attention:
+            # self-attention weights are never consumed, so skip materializing them
+            wv = self.fused_qkv_attention(q, k, v, mask)
+            return self.out(wv), (k, v), None
+
         wv, qk = self.qkv_attention(q, k, v, mask)
         return self.out(wv), (k, v), qk
 
+    def fused_qkv_attention(self, q, k, v, mask=None):
+        n_batch, n_ctx, n_state = q.shape
+        scale = (n_state // self.n_head) ** -0.5
+        q = q.reshape(*q.shape[:2], self.n_head, -1).transpose(0, 2, 1, 3)
+        k = k.reshape(*k.shape[:2], self.n_head, -1).transpose(0, 2, 1, 3)
+        v = v.reshape(*v.shape[:2], self.n_head, -1).transpose(0, 2, 1, 3)
+
+        if mask is not None:
+            mask = mask[:n_ctx, :n_ctx]
+
+        out = mx.fast.scaled_dot_product_attention(q, k, v, scale=scale, mask=mask)
+        out = out.transpose(0, 2, 1, 3)
+        return out.reshape(n_batch, n_ctx, n_state)
+
     def qkv_attention(self, q, k, v, mask=None):
         n_batch, n_ctx, n_state = q.shape
         scale = (n_state // self.n_head) ** -0.25